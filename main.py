@@ -12,10 +12,16 @@ import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from enum import Enum
 from collections import deque
+from itertools import islice
+from operator import attrgetter
 import curses
 import atexit
+import re
+
+_NETDEV_PATTERN = re.compile(r'^\s*([^\s:]+):\s*(\d+)(?:\s+\d+){7}\s+(\d+)(?:\s+\d+){7}\s*$', re.M)
 
 class GlyphType(Enum):
     FLOW = "flow"
@@ -24,7 +30,26 @@ class GlyphType(Enum):
     SHADOW = "shadow"
     ECHO = "echo"
 
-@dataclass
+_GLYPH_CHARS = {
+    GlyphType.FLOW: ("↗", "↘", "↖", "↙", "↕", "↔"),
+    GlyphType.PULSE: ("●", "○", "◎", "◉", "⊙"),
+    GlyphType.WHISPER: ("…", "~", "⋮", "⋯"),
+    GlyphType.SHADOW: ("░", "▒", "▓", "▚", "▞"),
+    GlyphType.ECHO: ("⦿", "⟳", "⟲", "↻", "↺"),
+}
+
+_SPIRIT_NAMES = {
+    'eth': ('Silent River', 'Whispering Wind', 'Ethereal Flow'),
+    'wlan': ('Air Spirit', 'Cloud Dancer', 'Sky Whisper'),
+    'lo': ('Inner Echo', 'Soul Mirror', 'Self Reflection'),
+    'veth': ('Bridge Guardian', 'Gatekeeper', 'Threshold Walker'),
+    'docker': ('Container Spirit', 'Boxed Essence', 'Isolated Soul'),
+    'tun': ('Tunnel Dreamer', 'Veil Piercer', 'Hidden Path'),
+    'tap': ('Mirror Pool', 'Reflection Well', 'Surface Tension'),
+}
+_SPIRIT_PREFIX_LENGTHS = sorted({len(prefix) for prefix in _SPIRIT_NAMES}, reverse=True)
+
+@dataclass(slots=True)
 class Glyph:
     type: GlyphType
     intensity: float
@@ -35,31 +60,29 @@ class Glyph:
     
 class NetworkEntity:
     def __init__(self, name: str, interface: str):
-        self.name = self._generate_spirit_name(name)
         self.interface = interface
+        self._spirit_source = name
         self.rx_bytes = 0
         self.tx_bytes = 0
         self.rx_rate = 0.0
         self.tx_rate = 0.0
+        self.total_rate = 0.0
+        self.rx_display = ""
+        self.tx_display = ""
         self.essence = random.uniform(0.1, 1.0)
         self.aura = self._generate_aura()
         self.glyphs: List[Glyph] = []
         self.last_seen = time.time()
         self.whispers: List[str] = []
+    
+    @cached_property
+    def name(self) -> str:
+        return self._generate_spirit_name(self._spirit_source)
         
     def _generate_spirit_name(self, interface: str) -> str:
-        names = {
-            'eth': ['Silent River', 'Whispering Wind', 'Ethereal Flow'],
-            'wlan': ['Air Spirit', 'Cloud Dancer', 'Sky Whisper'],
-            'lo': ['Inner Echo', 'Soul Mirror', 'Self Reflection'],
-            'veth': ['Bridge Guardian', 'Gatekeeper', 'Threshold Walker'],
-            'docker': ['Container Spirit', 'Boxed Essence', 'Isolated Soul'],
-            'tun': ['Tunnel Dreamer', 'Veil Piercer', 'Hidden Path'],
-            'tap': ['Mirror Pool', 'Reflection Well', 'Surface Tension']
-        }
-        
-        for prefix, spirit_names in names.items():
-            if interface.startswith(prefix):
+        for length in _SPIRIT_PREFIX_LENGTHS:
+            spirit_names = _SPIRIT_NAMES.get(interface[:length])
+            if spirit_names:
                 return f"{random.choice(spirit_names)} ({interface})"
         
         mystic_suffixes = [' the Observer', ' the Watcher', ' the Listener', 
@@ -82,58 +105,42 @@ class NetworkEntity:
         ]
         return random.choice(auras)
     
-    def add_whisper(self, message: str):
-        timestamp = datetime.now().strftime("%H:%M:%S")
+    def add_whisper(self, message: str, timestamp: Optional[str] = None):
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%H:%M:%S")
         self.whispers.append(f"[{timestamp}] {message}")
         if len(self.whispers) > 5:
             self.whispers.pop(0)
     
     def update_glyphs(self):
-        if len(self.glyphs) > 20:
-            self.glyphs = self.glyphs[-20:]
-            
         active_glyphs = []
-        for glyph in self.glyphs:
+        for glyph in self.glyphs[-20:]:
             glyph.age += 1
             glyph.intensity *= 0.95
             
             if glyph.intensity > 0.1:
                 active_glyphs.append(glyph)
-                
-            if glyph.type == GlyphType.FLOW:
-                glyph.char = random.choice(["↗", "↘", "↖", "↙", "↕", "↔"])
-            elif glyph.type == GlyphType.PULSE:
-                glyph.char = random.choice(["●", "○", "◎", "◉", "⊙"])
-            elif glyph.type == GlyphType.WHISPER:
-                glyph.char = random.choice(["…", "~", "⋮", "⋯"])
-            elif glyph.type == GlyphType.SHADOW:
-                glyph.char = random.choice(["░", "▒", "▓", "▚", "▞"])
-            elif glyph.type == GlyphType.ECHO:
-                glyph.char = random.choice(["⦿", "⟳", "⟲", "↻", "↺"])
+                chars = _GLYPH_CHARS[glyph.type]
+                glyph.char = chars[int(random.random() * len(chars))]
         
         self.glyphs = active_glyphs
         
         flow_intensity = min(self.rx_rate + self.tx_rate, 1000) / 1000
         
         if random.random() < flow_intensity * 0.3:
-            x = random.randint(0, 20)
-            y = random.randint(0, 5)
-            self.glyphs.append(Glyph(
-                type=GlyphType.FLOW,
-                intensity=flow_intensity,
-                position=(x, y),
-                color_pair=random.randint(1, 6)
-            ))
+            self._spawn_glyph(GlyphType.FLOW, flow_intensity)
         
         if random.random() < self.essence * 0.2:
-            x = random.randint(0, 20)
-            y = random.randint(0, 5)
-            self.glyphs.append(Glyph(
-                type=GlyphType.WHISPER,
-                intensity=self.essence,
-                position=(x, y),
-                color_pair=random.randint(1, 6)
-            ))
+            self._spawn_glyph(GlyphType.WHISPER, self.essence)
+    
+    def _spawn_glyph(self, glyph_type: GlyphType, intensity: float):
+        roll = random.random
+        self.glyphs.append(Glyph(
+            type=glyph_type,
+            intensity=intensity,
+            position=(int(roll() * 21), int(roll() * 6)),
+            color_pair=1 + int(roll() * 6)
+        ))
 
 class MysticConfig:
     UPDATE_INTERVAL = 1.0
@@ -166,10 +173,15 @@ class MysticConfig:
             pass
 
 class AncientScript:
+    SYMBOLS = ("Ⅰ", "Ⅱ", "Ⅲ", "Ⅳ", "Ⅴ", "Ⅵ", "Ⅶ", "Ⅷ", "Ⅸ", "Ⅹ",
+               "Ⅺ", "Ⅻ", "ↀ", "ↁ", "ↂ", "Ↄ", "ↅ", "ↆ", "ↇ", "ↈ")
+    RATE_UNITS = ("Ⓑ/ⓢ", "ⓀⒷ/ⓢ", "ⓂⒷ/ⓢ", "ⒼⒷ/ⓢ", "ⓉⒷ/ⓢ")
+    RATE_DIVISORS = (1, 1024, 1024**2, 1024**3, 1024**4)
+    
     @staticmethod
+    @lru_cache(maxsize=4096)
     def encode_number(num: float) -> str:
-        symbols = ["Ⅰ", "Ⅱ", "Ⅲ", "Ⅳ", "Ⅴ", "Ⅵ", "Ⅶ", "Ⅷ", "Ⅸ", "Ⅹ",
-                  "Ⅺ", "Ⅻ", "ↀ", "ↁ", "ↂ", "Ↄ", "ↅ", "ↆ", "ↇ", "ↈ"]
+        symbols = AncientScript.SYMBOLS
         
         if num < 1:
             return "↊"
@@ -185,14 +197,15 @@ class AncientScript:
         return "".join(reversed(result))
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def encode_rate(rate: float) -> str:
-        units = ["Ⓑ/ⓢ", "ⓀⒷ/ⓢ", "ⓂⒷ/ⓢ", "ⒼⒷ/ⓢ", "ⓉⒷ/ⓢ"]
-        divisors = [1, 1024, 1024**2, 1024**3, 1024**4]
+        units = AncientScript.RATE_UNITS
+        divisors = AncientScript.RATE_DIVISORS
+        int_rate = int(rate)
         
         for i in range(len(units) - 1, -1, -1):
-            if rate >= divisors[i]:
-                value = rate / divisors[i]
-                symbol = AncientScript.encode_number(value)
+            if int_rate >= divisors[i]:
+                symbol = AncientScript.encode_number(int_rate // divisors[i])
                 return f"{symbol} {units[i]}"
         
         return f"↊ {units[0]}"
@@ -213,17 +226,37 @@ class AncientScript:
 class WhisperCollector:
     def __init__(self):
         self.whispers = deque(maxlen=100)
+        self._stamp_second = -1
+        self._stamp = ""
+        
+    def _timestamp(self) -> str:
+        now = int(time.time())
+        if now != self._stamp_second:
+            self._stamp_second = now
+            self._stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        return self._stamp
         
     def add_whisper(self, source: str, message: str, level: str = "INFO") -> str:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = self._timestamp()
         whisper = f"[{timestamp}] [{level}] {source}: {message}"
         self.whispers.append(whisper)
         return whisper
     
     def get_recent_whispers(self, count: int = 10) -> List[str]:
-        return list(self.whispers)[-count:]
+        total = len(self.whispers)
+        return list(islice(self.whispers, max(0, total - count), total))
+
+_FLOW_BARS = "▁▂▃▄▅▆▇█"
+# Bar character for each flow height 0-4.
+_FLOW_BAR_LEVELS = "".join(_FLOW_BARS[h * len(_FLOW_BARS) // 5] for h in range(5))
 
 class NetworkMystic:
+    IP_CACHE_TTL = 5.0
+    MIN_TICK_MS = 100
+    BORDER_CHARS = "╔╗╚╝═║"
+    FLOW_BARS = _FLOW_BARS
+    FLOW_BAR_LEVELS = _FLOW_BAR_LEVELS
+    
     def __init__(self, config: MysticConfig):
         self.config = config
         self.entities: Dict[str, NetworkEntity] = {}
@@ -231,7 +264,16 @@ class NetworkMystic:
         self.last_update = time.time()
         self.running = False
         self.colors = {}
+        self._attr_table: List[Tuple[int, int, int, int]] = []
         self._lock = threading.Lock()
+        self._netdev_fd: Optional[int] = None
+        self._sorted_spirits: List[NetworkEntity] = []
+        self._ip_cache: Dict[str, List[str]] = {}
+        self._ip_cache_time = 0.0
+        self._border_width: Optional[int] = None
+        self._border_top = ""
+        self._border_middle = ""
+        self._border_bottom = ""
         self.init_rituals()
         
     def init_rituals(self):
@@ -262,6 +304,16 @@ class NetworkMystic:
                 self.colors[pair_id] = curses.color_pair(pair_id)
         except:
             self.colors = {i: curses.A_NORMAL for i in range(1, 8)}
+        
+        self._attr_table = []
+        for pair_id in range(8):
+            base = self.colors.get(pair_id, curses.A_NORMAL)
+            self._attr_table.append((
+                base,
+                base | curses.A_BOLD,
+                base | curses.A_DIM,
+                base | curses.A_BOLD | curses.A_DIM,
+            ))
     
     def _ritual_moon_cycle(self) -> str:
         now = time.time()
@@ -312,34 +364,37 @@ class NetworkMystic:
             result = ritual()
             self.whispers.add_whisper("Ritual", result, "MYSTIC")
     
+    def _read_netdev(self) -> str:
+        if self._netdev_fd is None:
+            self._netdev_fd = os.open('/proc/net/dev', os.O_RDONLY)
+        
+        chunks = []
+        offset = 0
+        while True:
+            chunk = os.pread(self._netdev_fd, 8192, offset)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            offset += len(chunk)
+        return b"".join(chunks).decode()
+    
     def scan_spirits(self):
         try:
-            with open('/proc/net/dev', 'r') as f:
-                lines = f.readlines()[2:]
+            raw = self._read_netdev()
             
             current_time = time.time()
+            time_diff = current_time - self.last_update
+            whisper_time = time.strftime("%H:%M:%S", time.localtime(current_time))
             found_interfaces = set()
             
-            for line in lines:
-                if not line.strip():
-                    continue
-                    
-                parts = line.split(':')
-                if len(parts) < 2:
-                    continue
-                    
-                interface = parts[0].strip()
-                if not interface or (interface == 'lo' and not self.config.show_loopback):
+            for interface, rx_field, tx_field in _NETDEV_PATTERN.findall(raw):
+                if interface == 'lo' and not self.config.show_loopback:
                     continue
                 
                 found_interfaces.add(interface)
                 
-                data = parts[1].split()
-                if len(data) < 16:
-                    continue
-                
-                rx_bytes = int(data[0])
-                tx_bytes = int(data[8])
+                rx_bytes = int(rx_field)
+                tx_bytes = int(tx_field)
                 
                 if interface not in self.entities:
                     spirit = NetworkEntity(interface, interface)
@@ -350,115 +405,134 @@ class NetworkMystic:
                 entity = self.entities[interface]
                 entity.last_seen = current_time
                 
-                time_diff = current_time - self.last_update
                 if time_diff > 0:
                     entity.rx_rate = (rx_bytes - entity.rx_bytes) / time_diff
                     entity.tx_rate = (tx_bytes - entity.tx_bytes) / time_diff
                 
+                entity.total_rate = entity.rx_rate + entity.tx_rate
                 entity.rx_bytes = rx_bytes
                 entity.tx_bytes = tx_bytes
                 
                 if entity.rx_rate > 1000000:
-                    entity.add_whisper("Great flow from beyond")
+                    entity.add_whisper("Great flow from beyond", whisper_time)
                 elif entity.rx_rate < 1000 and entity.tx_rate < 1000:
-                    entity.add_whisper("Resting in silence")
+                    entity.add_whisper("Resting in silence", whisper_time)
                 elif entity.rx_rate > entity.tx_rate * 2:
-                    entity.add_whisper("Listening more than speaking")
+                    entity.add_whisper("Listening more than speaking", whisper_time)
                 elif entity.tx_rate > entity.rx_rate * 2:
-                    entity.add_whisper("Whispering to the void")
+                    entity.add_whisper("Whispering to the void", whisper_time)
                 
                 entity.update_glyphs()
             
-            expired = []
-            for iface, entity in self.entities.items():
-                if iface not in found_interfaces:
-                    expired.append(iface)
+            self.refresh_interface_ips()
+            
+            expired = self.entities.keys() - found_interfaces
             
             for iface in expired:
                 spirit = self.entities.pop(iface)
                 self.whispers.add_whisper("Veil",
                     f"Spirit '{spirit.name}' has faded", "SPIRIT")
+            
+            self._sorted_spirits = sorted(self.entities.values(),
+                                          key=attrgetter('total_rate'),
+                                          reverse=True)[:self.config.max_spirits]
+            
+            for spirit in self._sorted_spirits:
+                spirit.rx_display = self.describe_rate(spirit.rx_rate)
+                spirit.tx_display = self.describe_rate(spirit.tx_rate)
                 
         except Exception as e:
             self.whispers.add_whisper("Scanner", f"Failed to scan: {str(e)}", "ERROR")
     
-    def get_interface_ips(self, interface: str) -> List[str]:
+    def refresh_interface_ips(self):
+        now = time.time()
+        if now - self._ip_cache_time < self.IP_CACHE_TTL:
+            return
+        # Stamp before running ip so a failing or missing binary is only
+        # retried once per IP_CACHE_TTL rather than on every scan.
+        self._ip_cache_time = now
+        
         try:
-            result = subprocess.run(['ip', '-o', '-4', 'addr', 'show', interface],
+            result = subprocess.run(['ip', '-o', '-4', 'addr', 'show'],
                                   capture_output=True, text=True, timeout=2)
-            ips = []
+            ip_cache: Dict[str, List[str]] = {}
             for line in result.stdout.splitlines():
                 parts = line.split()
                 if len(parts) >= 4:
+                    interface = parts[1].split('@')[0]
                     ip = parts[3].split('/')[0]
                     if ip and ip != '127.0.0.1':
-                        ips.append(ip)
-            return ips
-        except subprocess.TimeoutExpired:
-            return []
+                        ip_cache.setdefault(interface, []).append(ip)
+            self._ip_cache = ip_cache
         except Exception:
-            return []
+            pass
+    
+    def get_interface_ips(self, interface: str) -> List[str]:
+        return self._ip_cache.get(interface, [])
+    
+    def _border_rows(self, width: int) -> Tuple[str, str, str]:
+        if self._border_width != width:
+            border_chars = self.BORDER_CHARS
+            self._border_top = border_chars[0] + border_chars[4] * (width - 2) + border_chars[1]
+            self._border_bottom = border_chars[2] + border_chars[4] * (width - 2) + border_chars[3]
+            self._border_middle = border_chars[5] + " " * (width - 2) + border_chars[5]
+            self._border_width = width
+        return self._border_top, self._border_middle, self._border_bottom
     
     def draw_veil_border(self, screen, height, width):
         if width < 2 or height < 2:
             return
             
-        border_chars = ["╔", "╗", "╚", "╝", "═", "║"]
+        top, middle, bottom = self._border_rows(width)
         
         for y in range(height):
             if y == 0:
-                try:
-                    screen.addstr(y, 0, border_chars[0] + border_chars[4] * (width - 2) + border_chars[1])
-                except:
-                    pass
+                row = top
             elif y == height - 1:
-                try:
-                    screen.addstr(y, 0, border_chars[2] + border_chars[4] * (width - 2) + border_chars[3])
-                except:
-                    pass
+                row = bottom
             else:
-                try:
-                    screen.addstr(y, 0, border_chars[5])
-                    screen.addstr(y, width - 1, border_chars[5])
-                except:
-                    pass
-    
-    def render_glyph(self, screen, glyph: Glyph, offset_x: int, offset_y: int):
-        x, y = glyph.position
-        screen_x = offset_x + x
-        screen_y = offset_y + y
-        
-        if 0 <= screen_x < curses.COLS and 0 <= screen_y < curses.LINES:
+                row = middle
             try:
-                attr = self.colors.get(glyph.color_pair, curses.A_NORMAL)
-                if glyph.intensity > 0.3:
-                    attr |= curses.A_BOLD
-                if glyph.intensity < 0.6:
-                    attr |= curses.A_DIM
-                    
-                screen.addstr(screen_y, screen_x, glyph.char, attr)
+                screen.addstr(y, 0, row)
             except:
                 pass
     
+    def render_glyphs(self, screen, glyphs: List[Glyph], offset_x: int, offset_y: int):
+        cols = curses.COLS
+        lines = curses.LINES
+        attr_table = self._attr_table
+        addstr = screen.addstr
+        
+        for glyph in glyphs:
+            x, y = glyph.position
+            screen_x = offset_x + x
+            screen_y = offset_y + y
+            
+            if 0 <= screen_x < cols and 0 <= screen_y < lines:
+                try:
+                    intensity = glyph.intensity
+                    flags = (intensity > 0.3) | ((intensity < 0.6) << 1)
+                    attr = attr_table[glyph.color_pair][flags]
+                    addstr(screen_y, screen_x, glyph.char, attr)
+                except:
+                    pass
+    
     def render_flow_visualization(self, screen, rx_rate: float, tx_rate: float, x: int, y: int, width: int):
         max_rate = 1000
         rx_height = min(int((rx_rate / max_rate) * 5), 5)
         tx_height = min(int((tx_rate / max_rate) * 5), 5)
         
-        rx_bar = "▁▂▃▄▅▆▇█"
-        tx_bar = "▁▂▃▄▅▆▇█"
+        bar_levels = self.FLOW_BAR_LEVELS
         
         for i in range(rx_height):
-            char_idx = min(i * len(rx_bar) // 5, len(rx_bar) - 1)
             try:
-                screen.addstr(y + 4 - i, x, rx_bar[char_idx], self.colors[2])
+                screen.addstr(y + 4 - i, x, bar_levels[i], self.colors[2])
             except:
                 pass
         
         for i in range(tx_height):
-            char_idx = min(i * len(tx_bar) // 5, len(tx_bar) - 1)
             try:
-                screen.addstr(y + 4 - i, x + 2, tx_bar[char_idx], self.colors[3])
+                screen.addstr(y + 4 - i, x + 2, bar_levels[i], self.colors[3])
             except:
                 pass
     
@@ -470,16 +544,9 @@ class NetworkMystic:
             screen.addstr(y_start, 2, f"╭─ {entity.name}", curses.A_BOLD)
             screen.addstr(y_start + 1, 2, f"│  Aura: {entity.aura}", self.colors[4])
             
-            if self.config.ancient_script:
-                rx_display = AncientScript.encode_rate(entity.rx_rate)
-                tx_display = AncientScript.encode_rate(entity.tx_rate)
-            else:
-                rx_display = self.format_rate(entity.rx_rate)
-                tx_display = self.format_rate(entity.tx_rate)
-            
-            screen.addstr(y_start + 2, 2, f"│  From Beyond: {rx_display}", 
+            screen.addstr(y_start + 2, 2, f"│  From Beyond: {entity.rx_display}", 
                          self.colors[2])
-            screen.addstr(y_start + 3, 2, f"│  To Void:     {tx_display}", 
+            screen.addstr(y_start + 3, 2, f"│  To Void:     {entity.tx_display}", 
                          self.colors[3])
             screen.addstr(y_start + 4, 2, f"│  Essence: {entity.essence:.2f}", 
                          curses.A_DIM)
@@ -501,12 +568,16 @@ class NetworkMystic:
             except:
                 pass
             
-            for glyph in entity.glyphs:
-                self.render_glyph(screen, glyph, 25, y_start - 4)
+            self.render_glyphs(screen, entity.glyphs, 25, y_start - 4)
                 
         except curses.error:
             pass
     
+    def describe_rate(self, rate: float) -> str:
+        if self.config.ancient_script:
+            return AncientScript.encode_rate(int(rate))
+        return self.format_rate(rate)
+    
     def format_rate(self, rate: float) -> str:
         units = ['B/s', 'KB/s', 'MB/s', 'GB/s', 'TB/s']
         divisor = 1024.0
@@ -519,7 +590,7 @@ class NetworkMystic:
     
     def draw_veil(self, screen):
         try:
-            screen.clear()
+            screen.erase()
             height, width = screen.getmaxyx()
             
             self.draw_veil_border(screen, height, width)
@@ -540,39 +611,32 @@ class NetworkMystic:
                     pass
             
             y = 2
-            spirits = sorted(self.entities.values(), 
-                           key=lambda e: e.rx_rate + e.tx_rate, 
-                           reverse=True)
-            
-            for spirit in spirits[:self.config.max_spirits]:
+            for spirit in self._sorted_spirits:
                 if y < height - 10:
                     self.draw_spirit_info(screen, spirit, y)
                     y += 9
             
-            self.draw_status_bar(screen, height, width)
+            self.draw_status_bar(screen, height, width, mystic_time)
             self.draw_whispers_panel(screen, height, width)
             
-            screen.refresh()
+            screen.noutrefresh()
+            curses.doupdate()
             
         except curses.error:
             pass
     
-    def draw_status_bar(self, screen, height: int, width: int):
+    def draw_status_bar(self, screen, height: int, width: int, mystic_time: str):
         try:
             status_y = height - 3
             total_rx = sum(e.rx_rate for e in self.entities.values())
             total_tx = sum(e.tx_rate for e in self.entities.values())
             
-            if self.config.ancient_script:
-                total_rx_disp = AncientScript.encode_rate(total_rx)
-                total_tx_disp = AncientScript.encode_rate(total_tx)
-            else:
-                total_rx_disp = self.format_rate(total_rx)
-                total_tx_disp = self.format_rate(total_tx)
+            total_rx_disp = self.describe_rate(total_rx)
+            total_tx_disp = self.describe_rate(total_tx)
             
             status = f"Total Flow: {total_rx_disp} ╫ {total_tx_disp}"
             status += f" │ Spirits: {len(self.entities)}"
-            status += f" │ {AncientScript.get_mystic_time()}"
+            status += f" │ {mystic_time}"
             
             if len(status) > width - 4:
                 status = status[:width - 4]
@@ -630,14 +694,14 @@ class NetworkMystic:
             curses.curs_set(0)
             curses.noecho()
             curses.cbreak()
-            screen.nodelay(1)
-            screen.timeout(100)
             
             self.running = True
             self.whispers.add_whisper("Mystic", "Beginning the ritual...", "INFO")
             
             while self.running:
                 try:
+                    remaining = self.last_update + self.config.update_interval - time.time()
+                    screen.timeout(max(self.MIN_TICK_MS, int(remaining * 1000)))
                     key = screen.getch()
                     
                     if key == ord('q'):
@@ -664,8 +728,6 @@ class NetworkMystic:
                         self.draw_veil(screen)
                         self.last_update = current_time
                     
-                    time.sleep(0.01)
-                    
                 except KeyboardInterrupt:
                     self.running = False
                 except Exception as e:
@@ -681,6 +743,7 @@ class NetworkMystic:
             return
             
         try:
+            timestamp = datetime.now().isoformat()
             mysteries = []
             for entity in self.entities.values():
                 mystery = {
@@ -691,21 +754,21 @@ class NetworkMystic:
                     'total_rx': entity.rx_bytes,
                     'total_tx': entity.tx_bytes,
                     'whispers': entity.whispers[-5:],
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': timestamp
                 }
                 mysteries.append(mystery)
             
             log_entry = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'mystic_time': AncientScript.get_mystic_time(),
                 'total_spirits': len(self.entities),
                 'mysteries': mysteries,
                 'system_whispers': self.whispers.get_recent_whispers(10)
             }
             
-            with open(self.config.log_file, 'a') as f:
-                json.dump(log_entry, f, indent=2, ensure_ascii=False)
-                f.write("\n")
+            payload = json.dumps(log_entry, ensure_ascii=False, separators=(',', ':'))
+            with open(self.config.log_file, 'a', encoding='utf-8') as f:
+                f.write(payload + "\n")
                 
         except Exception as e:
             self.whispers.add_whisper("Archivist", f"Failed to save: {str(e)}", "ERROR")
@@ -720,6 +783,10 @@ class NetworkMystic:
         self.whispers.add_whisper("Mystic", "Ritual complete. Veil closing...", "INFO")
         self.save_mysteries()
         
+        if self._netdev_fd is not None:
+            os.close(self._netdev_fd)
+            self._netdev_fd = None
+        
         sys.stderr.write(f"\nMysteries saved to {self.config.log_file}\n")
         sys.stderr.write("\nMay the flows guide you...\n")
         sys.stderr.write("\nControls:\n")